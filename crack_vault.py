@@ -5,8 +5,13 @@ import os
 import sys
 import itertools
 import string
+import re
 import zipfile
 import struct
+import multiprocessing
+import queue
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 try:
     import tkinter as tk
@@ -35,10 +40,7 @@ class HashMap:
         self._buckets = [None] * capacity
 
     def _hash(self, key):
-        h = 5381
-        for ch in str(key):
-            h = ((h << 5) + h + ord(ch)) & 0xFFFFFFFF
-        return h % self._capacity
+        return hash(key) % self._capacity
 
     def put(self, key, value):
         idx = self._hash(key)
@@ -125,60 +127,35 @@ class HashMap:
                 node = node.next
 
 
-class QueueNode:
-    __slots__ = ('data', 'next')
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-
 class Queue:
+    __slots__ = ('_items', 'enqueue')
     def __init__(self):
-        self._front = None
-        self._rear = None
-        self._size = 0
-
-    def enqueue(self, data):
-        node = QueueNode(data)
-        if self._rear:
-            self._rear.next = node
-        self._rear = node
-        if not self._front:
-            self._front = node
-        self._size += 1
+        self._items = deque()
+        self.enqueue = self._items.append
 
     def dequeue(self):
-        if not self._front:
+        if not self._items:
             return None
-        data = self._front.data
-        self._front = self._front.next
-        if not self._front:
-            self._rear = None
-        self._size -= 1
-        return data
+        return self._items.popleft()
 
     def peek(self):
-        return self._front.data if self._front else None
+        return self._items[0] if self._items else None
 
     def is_empty(self):
-        return self._size == 0
+        return not self._items
 
     def size(self):
-        return self._size
+        return len(self._items)
 
     def to_list(self):
-        result = []
-        node = self._front
-        while node:
-            result.append(node.data)
-            node = node.next
-        return result
+        return list(self._items)
 
 
 class TrieNode:
-    __slots__ = ('children', 'is_end', 'word')
+    __slots__ = ('children', 'extra', 'is_end', 'word')
     def __init__(self):
-        self.children = {}
+        self.children = [None] * 128
+        self.extra = None
         self.is_end = False
         self.word = None
 
@@ -190,18 +167,31 @@ class Trie:
     def insert(self, word):
         node = self.root
         for ch in word:
-            if ch not in node.children:
-                node.children[ch] = TrieNode()
-            node = node.children[ch]
+            idx = ord(ch)
+            if idx < 128:
+                child = node.children[idx]
+                if child is None:
+                    child = node.children[idx] = TrieNode()
+            else:
+                if node.extra is None:
+                    node.extra = {}
+                child = node.extra.get(ch)
+                if child is None:
+                    child = node.extra[ch] = TrieNode()
+            node = child
         node.is_end = True
         node.word = word
 
     def search_prefix(self, prefix):
         node = self.root
         for ch in prefix:
-            if ch not in node.children:
+            idx = ord(ch)
+            if idx < 128:
+                node = node.children[idx]
+            else:
+                node = node.extra.get(ch) if node.extra else None
+            if node is None:
                 return []
-            node = node.children[ch]
         results = []
         self._collect(node, results)
         return results
@@ -209,8 +199,12 @@ class Trie:
     def _collect(self, node, results):
         if node.is_end:
             results.append(node.word)
-        for child in node.children.values():
-            self._collect(child, results)
+        for child in node.children:
+            if child is not None:
+                self._collect(child, results)
+        if node.extra:
+            for child in node.extra.values():
+                self._collect(child, results)
 
 
 # =============================================================================
@@ -219,6 +213,14 @@ class Trie:
 
 class HashEngine:
     ALGORITHMS = HashMap()
+    _CTORS = {}
+    _BY_LEN = {}
+    _HEX = re.compile(r'[0-9a-fA-F]+')
+    _CRYPT_PREFIXES = (
+        ('$2a$', 'bcrypt'), ('$2b$', 'bcrypt'), ('$2y$', 'bcrypt'),
+        ('$argon2id$', 'argon2id'), ('$argon2i$', 'argon2i'), ('$argon2d$', 'argon2d'),
+        ('$1$', 'md5crypt'), ('$5$', 'sha256crypt'), ('$6$', 'sha512crypt'),
+    )
 
     @staticmethod
     def _init_algorithms():
@@ -227,28 +229,45 @@ class HashEngine:
             ('sha384', 96), ('sha512', 128), ('sha3_224', 56), ('sha3_256', 64),
             ('sha3_384', 96), ('sha3_512', 128), ('blake2b', 128), ('blake2s', 64),
         ]
+        factories = {}
+        try:
+            import blake3
+            algos.append(('blake3', 64))
+            factories['blake3'] = blake3.blake3
+        except ImportError:
+            pass
         for name, length in algos:
             HashEngine.ALGORITHMS.put(name, length)
+            HashEngine._CTORS[name] = factories.get(name) or getattr(hashlib, name)
+            HashEngine._BY_LEN.setdefault(length, []).append(name)
+
+    @staticmethod
+    def get_ctor(algo):
+        return HashEngine._CTORS.get(algo)
 
     @staticmethod
     def compute(text, algo='md5'):
-        fn = getattr(hashlib, algo, None)
+        fn = HashEngine._CTORS.get(algo)
         if fn is None:
             return None
-        return fn(text.encode('utf-8')).hexdigest()
+        if isinstance(text, str):
+            text = text.encode('utf-8')
+        return fn(text).hexdigest()
 
     @staticmethod
     def identify_hash(hash_str):
-        hash_len = len(hash_str.strip())
-        matches = []
-        for name, length in HashEngine.ALGORITHMS.items():
-            if length == hash_len:
-                matches.append(name)
-        return matches
+        h = hash_str.strip()
+        for prefix, name in HashEngine._CRYPT_PREFIXES:
+            if h.startswith(prefix):
+                return [name]
+        if not HashEngine._HEX.fullmatch(h):
+            return []
+        return list(HashEngine._BY_LEN.get(len(h), ()))
 
     @staticmethod
     def supported_algorithms():
-        return HashEngine.ALGORITHMS.keys()
+        # HashMap order follows hash(), which is salted per process for str.
+        return sorted(HashEngine.ALGORITHMS.keys())
 
 
 HashEngine._init_algorithms()
@@ -258,10 +277,26 @@ HashEngine._init_algorithms()
 # KEYWORD PATTERN FILTER (Priority Cracking)
 # =============================================================================
 
+LEET_MAP = {'a': '@', 'e': '3', 'i': '1', 'o': '0', 's': '$', 't': '7', 'l': '1', 'g': '9', 'b': '8'}
+LEET_TABLE = str.maketrans(LEET_MAP)
+LEET_BYTES = bytes.maketrans(''.join(LEET_MAP).encode(), ''.join(LEET_MAP.values()).encode())
+
 class KeywordFilter:
+    _SPECIAL_BYTES = bytes(b for b in range(128) if not chr(b).isalnum())
+    SPECIALS = ('!', '@', '#', '$', '%', '&', '*', '.', '-', '_', '~', '+', '=')
+    SUFFIXES = ('', '1', '12', '123', '1234', '!', '!!', '@', '#', '$',
+                '01', '99', '2024', '2025', '2026', '007', '69', '666',
+                '0', '00', '11', '22', '33', '44', '55', '77', '88',
+                '!@', '!@#', '@!', '#1', '$1', '1!', '123!', '1234!')
+    PREFIXES = ('', '!', '@', '#', '$', '1', '123', '!@', '!@#')
+    COMBO_SEPARATORS = ('', ' ', '_', '-', '.', '!', '@', '#', '1', '123')
+    COMBO_SUFFIXES = ('', '1', '123', '!', '@', '#', '2025', '2026')
+
     def __init__(self):
         self.trie = Trie()
         self.keywords = []
+        self.priority_count = 0
+        self._matcher = None
 
     def set_keywords(self, keyword_string):
         raw = keyword_string.replace(',', ' ')
@@ -269,111 +304,202 @@ class KeywordFilter:
         self.trie = Trie()
         for kw in self.keywords:
             self.trie.insert(kw)
+        self._matcher = None
+        if self.keywords:
+            self._matcher = re.compile(b'|'.join(re.escape(kw.encode('utf-8')) for kw in self.keywords))
 
+    # bytes.lower() only folds ASCII, so non-ASCII words are folded as text to
+    # keep matching keywords like 'café' against 'CAFÉ2020'.
     def _strip_specials(self, word):
-        return ''.join(ch for ch in word if ch.isalnum()).lower()
+        if word.isascii():
+            return word.translate(None, self._SPECIAL_BYTES).lower()
+        text = word.decode('utf-8', 'ignore')
+        return ''.join(ch for ch in text if ch.isalnum()).lower().encode('utf-8')
 
     def _generate_keyword_mutations(self):
-        seen = HashMap()
-        mutations = Queue()
-        specials = ['!', '@', '#', '$', '%', '&', '*', '.', '-', '_', '~', '+', '=']
-        suffixes = ['', '1', '12', '123', '1234', '!', '!!', '@', '#', '$',
-                    '01', '99', '2024', '2025', '2026', '007', '69', '666',
-                    '0', '00', '11', '22', '33', '44', '55', '77', '88',
-                    '!@', '!@#', '@!', '#1', '$1', '1!', '123!', '1234!']
-        prefixes = ['', '!', '@', '#', '$', '1', '123', '!@', '!@#']
+        singles = []
         for kw in self.keywords:
-            bases = [kw, kw.upper(), kw.capitalize(), kw.swapcase(), kw[::-1], kw + kw]
-            leet_map = {'a': '@', 'e': '3', 'i': '1', 'o': '0', 's': '$', 't': '7', 'l': '1', 'g': '9', 'b': '8'}
-            leet = list(kw.lower())
-            for idx, ch in enumerate(leet):
-                if ch in leet_map:
-                    leet[idx] = leet_map[ch]
-            bases.append(''.join(leet))
-            bases.append(''.join(leet).capitalize())
-            dashed = '-'.join(kw)
-            dotted = '.'.join(kw)
-            under = '_'.join(kw)
-            bases.extend([dashed, dotted, under])
+            leet = kw.translate(LEET_TABLE)
+            bases = (kw, kw.upper(), kw.capitalize(), kw.swapcase(), kw[::-1], kw + kw,
+                     leet, leet.capitalize(), '-'.join(kw), '.'.join(kw), '_'.join(kw))
             for b in bases:
-                for s in suffixes:
-                    for p in prefixes:
-                        candidate = p + b + s
-                        if not seen.contains(candidate):
-                            seen.put(candidate, True)
-                            mutations.enqueue(candidate)
-                for sp in specials:
-                    for variant in [sp + b, b + sp, sp + b + sp]:
-                        if not seen.contains(variant):
-                            seen.put(variant, True)
-                            mutations.enqueue(variant)
+                singles.extend([p + b + s for s in self.SUFFIXES for p in self.PREFIXES])
+                for sp in self.SPECIALS:
+                    singles.extend((sp + b, b + sp, sp + b + sp))
+        mutations = dict.fromkeys(singles)
         multi = []
-        if len(self.keywords) >= 2:
-            for i in range(len(self.keywords)):
-                for j in range(len(self.keywords)):
-                    if i != j:
-                        for sep in ['', ' ', '_', '-', '.', '!', '@', '#', '1', '123']:
-                            for combo_fn in [lambda a, b, s: a + s + b,
-                                             lambda a, b, s: a.capitalize() + s + b,
-                                             lambda a, b, s: a + s + b.capitalize(),
-                                             lambda a, b, s: a.capitalize() + s + b.capitalize(),
-                                             lambda a, b, s: a.upper() + s + b.upper()]:
-                                c = combo_fn(self.keywords[i], self.keywords[j], sep)
-                                if not seen.contains(c):
-                                    seen.put(c, True)
-                                    multi.append(c)
-                            for suf in ['', '1', '123', '!', '@', '#', '2025', '2026']:
-                                for combo_fn in [lambda a, b, s: a + b + s,
-                                                 lambda a, b, s: a.capitalize() + b.capitalize() + s]:
-                                    c = combo_fn(self.keywords[i], self.keywords[j], suf)
-                                    if not seen.contains(c):
-                                        seen.put(c, True)
-                                        multi.append(c)
-        combo_q = Queue()
-        for m in multi:
-            combo_q.enqueue(m)
-        return combo_q, mutations
+        for i, a in enumerate(self.keywords):
+            for j, b in enumerate(self.keywords):
+                if i == j:
+                    continue
+                pairs = ((a, b), (a.capitalize(), b), (a, b.capitalize()),
+                         (a.capitalize(), b.capitalize()), (a.upper(), b.upper()))
+                joined = (a + b, a.capitalize() + b.capitalize())
+                for sep in self.COMBO_SEPARATORS:
+                    multi.extend([x + sep + y for x, y in pairs])
+                    for suf in self.COMBO_SUFFIXES:
+                        multi.extend([ab + suf for ab in joined])
+        return [c for c in dict.fromkeys(multi) if c not in mutations], list(mutations)
 
     def filter_wordlist(self, words):
+        if self._matcher is None:
+            self.priority_count = 0
+            yield from words
+            return
         combo_mutations, single_mutations = self._generate_keyword_mutations()
-        priority = Queue()
-        remaining = Queue()
-        seen = HashMap()
-
-        combo_list = combo_mutations.to_list()
-        for w in combo_list:
-            if not seen.contains(w):
-                seen.put(w, True)
-                priority.enqueue(w)
-
-        single_list = single_mutations.to_list()
-        for w in single_list:
-            if not seen.contains(w):
-                seen.put(w, True)
-                priority.enqueue(w)
+        remaining = []
+        seen = set()
+        search = self._matcher.search
+        self.priority_count = 0
+
+        for m in itertools.chain(combo_mutations, single_mutations):
+            w = m.encode('utf-8')
+            if w not in seen:
+                seen.add(w)
+                self.priority_count += 1
+                yield w
 
         for word in words:
-            if seen.contains(word):
+            if word in seen:
                 continue
-            word_lower = word.lower()
-            word_stripped = self._strip_specials(word)
-            matched = False
-            for kw in self.keywords:
-                if kw in word_lower or kw in word_stripped:
-                    matched = True
-                    break
-            if matched:
-                seen.put(word, True)
-                priority.enqueue(word)
+            if word.isascii():
+                word_lower = word.lower()
             else:
-                remaining.enqueue(word)
-        return priority, remaining
+                word_lower = word.decode('utf-8', 'ignore').lower().encode('utf-8')
+            if search(word_lower) or search(self._strip_specials(word)):
+                seen.add(word)
+                self.priority_count += 1
+                yield word
+            else:
+                remaining.append(word)
+        yield from remaining
 
 
 # =============================================================================
 # ATTACK MODULES
 # =============================================================================
 
+# The most recently parsed wordlist is kept so repeated attacks on the same
+# file (and attacks started concurrently) share one parse. Duplicate lines are
+# dropped there, keeping the first occurrence, so merged lists do not pay for
+# the same candidate twice.
+_wordlist_cache = {}
+_wordlist_lock = threading.Lock()
+
+
+def load_wordlist(path):
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    with _wordlist_lock:
+        words = _wordlist_cache.get(key)
+        if words is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+            unique = dict.fromkeys(map(bytes.strip, data.splitlines()))
+            unique.pop(b'', None)
+            words = list(unique)
+            _wordlist_cache.clear()
+            _wordlist_cache[key] = words
+    return words
+
+
+def _find_digest(ctor, words, target):
+    digests = [ctor(w).digest() for w in words]
+    try:
+        return digests.index(target)
+    except ValueError:
+        return -1
+
+
+# Worker processes receive the shared stop event through the pool initializer,
+# since multiprocessing events cannot be pickled as task arguments. Windows
+# rejects pools of more than 61 workers.
+_WORKERS = min(os.cpu_count() or 1, 61)
+_worker_stop = None
+
+
+def _init_worker(stop_event):
+    global _worker_stop
+    _worker_stop = stop_event
+
+
+def _crack_words_shard(words, target, algo, chunk_size):
+    ctor = HashEngine.get_ctor(algo)
+    for offset in range(0, len(words), chunk_size):
+        if _worker_stop.is_set():
+            return None, offset, words[offset - 1] if offset else b''
+        idx = _find_digest(ctor, words[offset:offset + chunk_size], target)
+        if idx >= 0:
+            _worker_stop.set()
+            return words[offset + idx], offset + idx + 1, words[offset + idx]
+    return None, len(words), words[-1]
+
+
+# Brute-force candidates are split into head + tail, where every tail of the
+# largest length that fits in one chunk is precomputed once per length. Each
+# head is hashed once and its state copied for every tail, so candidates are
+# only materialised when one is reported.
+def _brute_chunks(charset_bytes, length, chunk_size, prefix=b''):
+    join = b''.join
+    tail_len = 1
+    while tail_len < length and len(charset_bytes) ** (tail_len + 1) <= chunk_size:
+        tail_len += 1
+    tail_len = min(tail_len, length)
+    tails = [join(combo) for combo in itertools.product(charset_bytes, repeat=tail_len)]
+    for head in itertools.product(charset_bytes, repeat=length - tail_len):
+        yield prefix + join(head), tails
+
+
+def _find_tail_digest(base, tails, target):
+    copy = base.copy
+    digests = []
+    append = digests.append
+    for tail in tails:
+        h = copy()
+        h.update(tail)
+        append(h.digest())
+    try:
+        return digests.index(target)
+    except ValueError:
+        return -1
+
+
+def _crack_prefix_shard(prefix, charset_bytes, length, target, algo, chunk_size):
+    ctor = HashEngine.get_ctor(algo)
+    attempts = 0
+    last = prefix
+    for head, tails in _brute_chunks(charset_bytes, length - 1, chunk_size, prefix):
+        if _worker_stop.is_set():
+            break
+        idx = _find_tail_digest(ctor(head), tails, target)
+        if idx >= 0:
+            _worker_stop.set()
+            return head + tails[idx], attempts + idx + 1, head + tails[idx]
+        attempts += len(tails)
+        last = head + tails[-1]
+    return None, attempts, last
+
+
+# Tasks are (offset, args) pairs; each result is yielded with the offset of
+# the candidate range its shard started at, so a hit can be reported at its
+# position in the full candidate order however the shards finish.
+def _run_shards(attack, fn, tasks):
+    ctx = multiprocessing.get_context('spawn')
+    attack._stop_event = ctx.Event()
+    if attack.stopped:
+        attack._stop_event.set()
+    with ProcessPoolExecutor(max_workers=_WORKERS, mp_context=ctx,
+                             initializer=_init_worker, initargs=(attack._stop_event,)) as pool:
+        futures = {pool.submit(fn, *args): offset for offset, args in tasks}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            attack._stop_event.set()
+            for future in futures:
+                future.cancel()
+
+
 class AttackResult:
     def __init__(self):
         self.found = False
@@ -385,167 +511,288 @@ class AttackResult:
 
 
 class WordlistAttack:
+    CHUNK_SIZE = 4096
+    SHARD_SIZE = 65536
+    PARALLEL_THRESHOLD = 200000
+
     def __init__(self, callback=None):
         self.callback = callback
         self.stopped = False
+        self.progress = (0, 0, b'')
+        self._stop_event = None
 
     def crack_hash(self, target_hash, algo, wordlist_path, keyword_filter=None):
         result = AttackResult()
         result.method = "Wordlist Attack"
         start = time.time()
+        ctor = HashEngine.get_ctor(algo)
+        if ctor is None:
+            result.method = f"Error: Unsupported algorithm {algo}"
+            return result
+        try:
+            target = bytes.fromhex(target_hash.strip())
+        except ValueError:
+            result.method = "Error: Target hash is not hexadecimal"
+            return result
         try:
-            words = []
-            with open(wordlist_path, 'r', errors='ignore') as f:
-                for line in f:
-                    w = line.strip()
-                    if w:
-                        words.append(w)
+            words = load_wordlist(wordlist_path)
         except FileNotFoundError:
             result.method = "Error: Wordlist not found"
             return result
 
         if keyword_filter and keyword_filter.keywords:
-            priority_q, remaining_q = keyword_filter.filter_wordlist(words)
-            ordered_words = priority_q.to_list() + remaining_q.to_list()
+            ordered_words = list(keyword_filter.filter_wordlist(words))
         else:
             ordered_words = words
 
         total = len(ordered_words)
-        for i, word in enumerate(ordered_words):
+        if _WORKERS > 1 and total >= self.PARALLEL_THRESHOLD:
+            return self._crack_parallel(ordered_words, target, algo, result, start)
+        for offset in range(0, total, self.CHUNK_SIZE):
             if self.stopped:
                 break
-            computed = HashEngine.compute(word, algo)
-            result.attempts += 1
-            if computed == target_hash.lower().strip():
+            chunk = ordered_words[offset:offset + self.CHUNK_SIZE]
+            idx = _find_digest(ctor, chunk, target)
+            if idx >= 0:
+                result.attempts += idx + 1
                 result.found = True
-                result.password = word
+                result.password = chunk[idx].decode('utf-8', 'replace')
                 result.elapsed = time.time() - start
                 result.speed = result.attempts / max(result.elapsed, 0.001)
                 if self.callback:
-                    self.callback(result.attempts, total, word, True)
+                    self.callback(result.attempts, total, result.password, True)
                 return result
-            if self.callback and result.attempts % 500 == 0:
-                self.callback(result.attempts, total, word, False)
+            result.attempts += len(chunk)
+            self.progress = (result.attempts, total, chunk[-1])
+            if self.callback:
+                self.callback(result.attempts, total, chunk[-1].decode('utf-8', 'replace'), False)
 
         result.elapsed = time.time() - start
         result.speed = result.attempts / max(result.elapsed, 0.001)
         return result
 
+    def _crack_parallel(self, words, target, algo, result, start):
+        total = len(words)
+        tasks = [(offset, (words[offset:offset + self.SHARD_SIZE], target, algo, self.CHUNK_SIZE))
+                 for offset in range(0, total, self.SHARD_SIZE)]
+        try:
+            for offset, (password, attempts, last) in _run_shards(self, _crack_words_shard, tasks):
+                if password is not None:
+                    result.attempts = offset + attempts
+                    result.found = True
+                    result.password = password.decode('utf-8', 'replace')
+                    if self.callback:
+                        self.callback(result.attempts, total, result.password, True)
+                    break
+                result.attempts += attempts
+                self.progress = (result.attempts, total, last)
+                if self.callback:
+                    self.callback(result.attempts, total, last.decode('utf-8', 'replace'), False)
+        except Exception as e:
+            result.method = f"Error: Parallel attack failed ({type(e).__name__}: {e})"
+        result.elapsed = time.time() - start
+        result.speed = result.attempts / max(result.elapsed, 0.001)
+        return result
+
     def stop(self):
         self.stopped = True
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 class BruteForceAttack:
+    CHUNK_SIZE = 4096
+    PARALLEL_THRESHOLD = 200000
+
     def __init__(self, callback=None):
         self.callback = callback
         self.stopped = False
+        self.progress = (0, 0, b'')
+        self._stop_event = None
 
     def crack_hash(self, target_hash, algo, charset, min_len, max_len):
         result = AttackResult()
         result.method = "Brute Force Attack"
         start = time.time()
+        ctor = HashEngine.get_ctor(algo)
+        if ctor is None:
+            result.method = f"Error: Unsupported algorithm {algo}"
+            return result
+        try:
+            target = bytes.fromhex(target_hash.strip())
+        except ValueError:
+            result.method = "Error: Target hash is not hexadecimal"
+            return result
+        if isinstance(charset, bytes):
+            charset_bytes = [bytes((b,)) for b in charset]
+        else:
+            charset_bytes = [c.encode('utf-8') for c in charset]
         for length in range(min_len, max_len + 1):
-            for combo in itertools.product(charset, repeat=length):
+            if _WORKERS > 1 and length > 1 and len(charset_bytes) ** length >= self.PARALLEL_THRESHOLD:
+                try:
+                    self._crack_parallel(charset_bytes, length, target, algo, result)
+                except Exception as e:
+                    result.method = f"Error: Parallel attack failed ({type(e).__name__}: {e})"
+                    break
+                if result.found or self.stopped:
+                    break
+                continue
+            for head, tails in _brute_chunks(charset_bytes, length, self.CHUNK_SIZE):
                 if self.stopped:
                     result.elapsed = time.time() - start
                     result.speed = result.attempts / max(result.elapsed, 0.001)
                     return result
-                word = ''.join(combo)
-                computed = HashEngine.compute(word, algo)
-                result.attempts += 1
-                if computed == target_hash.lower().strip():
+                idx = _find_tail_digest(ctor(head), tails, target)
+                if idx >= 0:
+                    result.attempts += idx + 1
                     result.found = True
-                    result.password = word
+                    result.password = (head + tails[idx]).decode('utf-8', 'replace')
                     result.elapsed = time.time() - start
                     result.speed = result.attempts / max(result.elapsed, 0.001)
                     if self.callback:
-                        self.callback(result.attempts, 0, word, True)
+                        self.callback(result.attempts, 0, result.password, True)
                     return result
-                if self.callback and result.attempts % 1000 == 0:
-                    self.callback(result.attempts, 0, word, False)
+                result.attempts += len(tails)
+                last = head + tails[-1]
+                self.progress = (result.attempts, 0, last)
+                if self.callback:
+                    self.callback(result.attempts, 0, last.decode('utf-8', 'replace'), False)
         result.elapsed = time.time() - start
         result.speed = result.attempts / max(result.elapsed, 0.001)
         return result
 
+    def _crack_parallel(self, charset_bytes, length, target, algo, result):
+        base = result.attempts
+        per_prefix = len(charset_bytes) ** (length - 1)
+        tasks = [(base + i * per_prefix, (prefix, charset_bytes, length, target, algo, self.CHUNK_SIZE))
+                 for i, prefix in enumerate(charset_bytes)]
+        for offset, (password, attempts, last) in _run_shards(self, _crack_prefix_shard, tasks):
+            if password is not None:
+                result.attempts = offset + attempts
+                result.found = True
+                result.password = password.decode('utf-8', 'replace')
+                if self.callback:
+                    self.callback(result.attempts, 0, result.password, True)
+                return
+            result.attempts += attempts
+            self.progress = (result.attempts, 0, last)
+            if self.callback:
+                self.callback(result.attempts, 0, last.decode('utf-8', 'replace'), False)
+
     def stop(self):
         self.stopped = True
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 class RuleBasedAttack:
+    SUFFIXES = (b'1', b'12', b'123', b'1234', b'!', b'!!', b'@', b'#', b'01', b'99', b'2024', b'2025', b'007', b'69', b'666')
+    PREFIXES = (b'!', b'@', b'#', b'1', b'123')
+    CHUNK_SIZE = 256
+
     def __init__(self, callback=None):
         self.callback = callback
         self.stopped = False
+        self.progress = (0, 0, b'')
 
     def generate_mutations(self, word):
-        mutations = Queue()
-        mutations.enqueue(word)
-        mutations.enqueue(word.upper())
-        mutations.enqueue(word.lower())
-        mutations.enqueue(word.capitalize())
-        mutations.enqueue(word.swapcase())
-        mutations.enqueue(word[::-1])
-        mutations.enqueue(word + word)
-        leet_map = HashMap()
-        leet_map.put('a', '@'); leet_map.put('e', '3'); leet_map.put('i', '1')
-        leet_map.put('o', '0'); leet_map.put('s', '$'); leet_map.put('t', '7')
-        leet_map.put('l', '1'); leet_map.put('g', '9'); leet_map.put('b', '8')
-        leet = list(word.lower())
-        for idx, ch in enumerate(leet):
-            replacement = leet_map.get(ch)
-            if replacement:
-                leet[idx] = replacement
-        mutations.enqueue(''.join(leet))
-        suffixes = ['1', '12', '123', '1234', '!', '!!', '@', '#', '01', '99', '2024', '2025', '007', '69', '666']
-        for s in suffixes:
-            mutations.enqueue(word + s)
-            mutations.enqueue(word.capitalize() + s)
-        prefixes = ['!', '@', '#', '1', '123']
-        for p in prefixes:
-            mutations.enqueue(p + word)
-        return mutations
+        for column in self._mutate_chunk([word]):
+            yield column[0]
+
+    # Rules are applied a chunk of words at a time: each yielded list is one
+    # rule over the whole chunk, so every rule is a single C-level map or
+    # comprehension rather than a generator step per word.
+    # bytes case methods only fold ASCII and [::-1] would split UTF-8
+    # sequences, so a chunk holding non-ASCII words applies those rules as text.
+    def _mutate_chunk(self, words):
+        if all(map(bytes.isascii, words)):
+            upper = list(map(bytes.upper, words))
+            lower = list(map(bytes.lower, words))
+            capitalized = list(map(bytes.capitalize, words))
+            swapped = list(map(bytes.swapcase, words))
+            reversed_words = [w[::-1] for w in words]
+            leet = [w.translate(LEET_BYTES) for w in lower]
+        else:
+            texts = [w.decode('utf-8', 'surrogateescape') for w in words]
+
+            def encode(strs):
+                return [t.encode('utf-8', 'surrogateescape') for t in strs]
+
+            lower_texts = list(map(str.lower, texts))
+            upper = encode(map(str.upper, texts))
+            lower = encode(lower_texts)
+            capitalized = encode(map(str.capitalize, texts))
+            swapped = encode(map(str.swapcase, texts))
+            reversed_words = encode(t[::-1] for t in texts)
+            leet = encode(t.translate(LEET_TABLE) for t in lower_texts)
+        yield words
+        yield upper
+        yield lower
+        yield capitalized
+        yield swapped
+        yield reversed_words
+        yield [w + w for w in words]
+        yield leet
+        for s in self.SUFFIXES:
+            yield [w + s for w in words]
+            yield [c + s for c in capitalized]
+        for p in self.PREFIXES:
+            yield [p + w for w in words]
 
     def crack_hash(self, target_hash, algo, wordlist_path, keyword_filter=None):
         result = AttackResult()
         result.method = "Rule-Based Attack"
         start = time.time()
+        ctor = HashEngine.get_ctor(algo)
+        if ctor is None:
+            result.method = f"Error: Unsupported algorithm {algo}"
+            return result
         try:
-            words = []
-            with open(wordlist_path, 'r', errors='ignore') as f:
-                for line in f:
-                    w = line.strip()
-                    if w:
-                        words.append(w)
+            target = bytes.fromhex(target_hash.strip())
+        except ValueError:
+            result.method = "Error: Target hash is not hexadecimal"
+            return result
+        try:
+            words = load_wordlist(wordlist_path)
         except FileNotFoundError:
             result.method = "Error: Wordlist not found"
             return result
 
         if keyword_filter and keyword_filter.keywords:
-            pq, rq = keyword_filter.filter_wordlist(words)
-            ordered = pq.to_list() + rq.to_list()
+            ordered = list(keyword_filter.filter_wordlist(words))
         else:
             ordered = words
 
         total = len(ordered)
-        for i, word in enumerate(ordered):
+        for offset in range(0, total, self.CHUNK_SIZE):
             if self.stopped:
                 break
-            mutations = self.generate_mutations(word)
-            while not mutations.is_empty():
-                if self.stopped:
-                    break
-                mutant = mutations.dequeue()
-                computed = HashEngine.compute(mutant, algo)
-                result.attempts += 1
-                if computed == target_hash.lower().strip():
-                    result.found = True
-                    result.password = mutant
-                    result.elapsed = time.time() - start
-                    result.speed = result.attempts / max(result.elapsed, 0.001)
-                    if self.callback:
-                        self.callback(i + 1, total, mutant, True)
-                    return result
-            if self.callback and (i + 1) % 100 == 0:
-                self.callback(i + 1, total, word, False)
+            chunk = ordered[offset:offset + self.CHUNK_SIZE]
+            # Candidates are tried word by word, so the first hit is the one
+            # with the lowest word index, then the lowest rule index.
+            hit = None
+            limit = len(chunk)
+            rules = 0
+            for rule, column in enumerate(self._mutate_chunk(chunk)):
+                rules += 1
+                idx = _find_digest(ctor, column[:limit], target)
+                if idx >= 0:
+                    hit = (idx, rule, column[idx])
+                    limit = idx
+            if hit is not None:
+                idx, rule, password = hit
+                result.attempts += idx * rules + rule + 1
+                result.found = True
+                result.password = password.decode('utf-8', 'replace')
+                result.elapsed = time.time() - start
+                result.speed = result.attempts / max(result.elapsed, 0.001)
+                if self.callback:
+                    self.callback(offset + idx + 1, total, result.password, True)
+                return result
+            result.attempts += len(chunk) * rules
+            self.progress = (offset + len(chunk), total, chunk[-1])
+            if self.callback:
+                self.callback(offset + len(chunk), total, chunk[-1].decode('utf-8', 'replace'), False)
 
         result.elapsed = time.time() - start
         result.speed = result.attempts / max(result.elapsed, 0.001)
@@ -555,11 +802,161 @@ class RuleBasedAttack:
         self.stopped = True
 
 
+def _open_zip(zip_path):
+    try:
+        import pyzipper
+        return pyzipper.AESZipFile(zip_path)
+    except ImportError:
+        return zipfile.ZipFile(zip_path)
+
+
+def _zip_probe(zf):
+    members = [zi for zi in zf.infolist() if not zi.is_dir()]
+    if not members:
+        return None, []
+    encrypted = [zi for zi in members if zi.flag_bits & 0x1]
+    return min(encrypted or members, key=lambda zi: zi.file_size), encrypted
+
+
+# ZipCrypto rejects a wrong password on its 12-byte encryption header, whose
+# last decrypted byte must match the CRC (or DOS time) check byte. Running the
+# key schedule directly avoids opening the member for the ~255/256 candidates
+# that fail it; survivors still go through zipfile for the real check.
+def _make_crc_table():
+    table = []
+    for i in range(256):
+        c = i
+        for _ in range(8):
+            c = (c >> 1) ^ 0xEDB88320 if c & 1 else c >> 1
+        table.append(c)
+    return table
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+def _zipcrypto_header(zf, zi):
+    if not zi.flag_bits & 0x1 or zi.flag_bits & 0x40 or zi.compress_type == 99:
+        return None
+    zf.fp.seek(zi.header_offset)
+    fh = zf.fp.read(30)
+    if len(fh) != 30 or fh[:4] != b'PK\x03\x04':
+        return None
+    name_len, extra_len = struct.unpack_from('<HH', fh, 26)
+    zf.fp.seek(name_len + extra_len, 1)
+    header = zf.fp.read(12)
+    if len(header) != 12:
+        return None
+    if zi.flag_bits & 0x8:
+        t = zi.date_time
+        check = (t[3] << 11 | t[4] << 5 | t[5] // 2) >> 8
+    else:
+        check = zi.CRC >> 24
+    return header, check
+
+
+def _zipcrypto_check(word, header, check):
+    crc = _CRC_TABLE
+    k0, k1, k2 = 0x12345678, 0x23456789, 0x34567890
+    for c in word:
+        k0 = (k0 >> 8) ^ crc[(k0 ^ c) & 0xFF]
+        k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        k2 = (k2 >> 8) ^ crc[(k2 ^ (k1 >> 24)) & 0xFF]
+    for c in header[:11]:
+        k = k2 | 2
+        c ^= ((k * (k ^ 1)) >> 8) & 0xFF
+        k0 = (k0 >> 8) ^ crc[(k0 ^ c) & 0xFF]
+        k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        k2 = (k2 >> 8) ^ crc[(k2 ^ (k1 >> 24)) & 0xFF]
+    k = k2 | 2
+    return header[11] ^ (((k * (k ^ 1)) >> 8) & 0xFF) == check
+
+
+def _zip_password_ok(zf, probe, encrypted, word, header=None):
+    if header is not None and not _zipcrypto_check(word, *header):
+        return False
+    try:
+        zf.read(probe, pwd=word)
+        for zi in encrypted:
+            if zi is not probe:
+                zf.read(zi, pwd=word)
+        return True
+    except (RuntimeError, zipfile.BadZipFile, Exception):
+        return False
+
+
+def _pdf_password_ok(pikepdf, pdf_path, word):
+    try:
+        with pikepdf.open(pdf_path, password=word):
+            return True
+    except Exception:
+        return False
+
+
+def _crack_zip_shard(zip_path, words):
+    with _open_zip(zip_path) as zf:
+        probe, encrypted = _zip_probe(zf)
+        header = _zipcrypto_header(zf, probe)
+        for i, word in enumerate(words):
+            if _worker_stop.is_set():
+                return None, i, words[i - 1] if i else b''
+            if _zip_password_ok(zf, probe, encrypted, word, header):
+                _worker_stop.set()
+                return word, i + 1, word
+    return None, len(words), words[-1]
+
+
+def _crack_pdf_shard(pdf_path, words):
+    import pikepdf
+    for i, word in enumerate(words):
+        if _worker_stop.is_set():
+            return None, i, words[i - 1] if i else b''
+        if _pdf_password_ok(pikepdf, pdf_path, word):
+            _worker_stop.set()
+            return word, i + 1, word
+    return None, len(words), words[-1]
+
+
+def _crack_file_parallel(attack, fn, path, words, priority_count, result, start):
+    total = len(words)
+    tasks = [(offset, (path, words[offset:offset + attack.SHARD_SIZE]))
+             for offset in range(0, total, attack.SHARD_SIZE)]
+    # The priority words are done once every shard starting inside them is.
+    priority_shards = {offset for offset, _ in tasks if offset < priority_count < total}
+    try:
+        for offset, (password, attempts, last) in _run_shards(attack, fn, tasks):
+            if password is not None:
+                result.attempts = offset + attempts
+                result.found = True
+                result.password = password.decode('utf-8', 'replace')
+                if attack.callback:
+                    attack.callback(result.attempts, total, result.password, True)
+                break
+            result.attempts += attempts
+            if offset in priority_shards:
+                priority_shards.discard(offset)
+                if not priority_shards and not attack.stopped:
+                    attack._log(f"[KEYWORD PRIORITY] Done with priority words, now trying remaining {total - priority_count} words...")
+            attack.progress = (result.attempts, total, last)
+            if attack.callback:
+                attack.callback(result.attempts, total, last.decode('utf-8', 'replace'), False)
+    except Exception as e:
+        result.method = f"Error: Parallel attack failed ({type(e).__name__}: {e})"
+    result.elapsed = time.time() - start
+    result.speed = result.attempts / max(result.elapsed, 0.001)
+    return result
+
+
 class ZipCracker:
+    SHARD_SIZE = 4096
+    PARALLEL_THRESHOLD = 50000
+
     def __init__(self, callback=None, log_callback=None):
         self.callback = callback
         self.log_callback = log_callback
         self.stopped = False
+        self.progress = (0, 0, b'')
+        self._stop_event = None
 
     def _log(self, msg):
         if self.log_callback:
@@ -570,78 +967,78 @@ class ZipCracker:
         result.method = "ZIP File Crack"
         start = time.time()
         try:
-            zf = zipfile.ZipFile(zip_path)
+            zf = _open_zip(zip_path)
         except Exception as e:
             result.method = f"Error: {e}"
             return result
+        probe, encrypted = _zip_probe(zf)
+        if probe is None:
+            zf.close()
+            result.method = "Error: ZIP archive has no files"
+            return result
+        header = _zipcrypto_header(zf, probe)
         try:
-            words = []
-            with open(wordlist_path, 'r', errors='ignore') as f:
-                for line in f:
-                    w = line.strip()
-                    if w:
-                        words.append(w)
+            words = load_wordlist(wordlist_path)
         except FileNotFoundError:
             result.method = "Error: Wordlist not found"
             return result
 
         priority_count = 0
         if keyword_filter and keyword_filter.keywords:
-            pq, rq = keyword_filter.filter_wordlist(words)
-            priority_list = pq.to_list()
-            remaining_list = rq.to_list()
-            priority_count = len(priority_list)
-            ordered = priority_list + remaining_list
+            ordered = list(keyword_filter.filter_wordlist(words))
+            priority_count = keyword_filter.priority_count
             self._log(f"[KEYWORD PRIORITY] {priority_count} words matched keywords, trying those FIRST")
             if priority_count <= 20:
-                for pw in priority_list:
-                    self._log(f"  >> Priority: {pw}")
+                for pw in ordered[:priority_count]:
+                    self._log(f"  >> Priority: {pw.decode('utf-8', 'replace')}")
         else:
             ordered = words
 
-        import tempfile
-        tmp_dir = tempfile.mkdtemp()
-
         total = len(ordered)
+        if _WORKERS > 1 and total >= self.PARALLEL_THRESHOLD:
+            zf.close()
+            return _crack_file_parallel(self, _crack_zip_shard, zip_path, ordered,
+                                        priority_count, result, start)
         for i, word in enumerate(ordered):
             if self.stopped:
                 break
             result.attempts += 1
             if priority_count > 0 and i == priority_count:
                 self._log(f"[KEYWORD PRIORITY] Done with priority words, now trying remaining {len(ordered) - priority_count} words...")
-            try:
-                zf.extractall(path=tmp_dir, pwd=word.encode('utf-8'))
+            if _zip_password_ok(zf, probe, encrypted, word, header):
                 result.found = True
-                result.password = word
+                result.password = word.decode('utf-8', 'replace')
                 result.elapsed = time.time() - start
                 result.speed = result.attempts / max(result.elapsed, 0.001)
                 if self.callback:
-                    self.callback(result.attempts, total, word, True)
+                    self.callback(result.attempts, total, result.password, True)
                 zf.close()
-                import shutil
-                shutil.rmtree(tmp_dir, ignore_errors=True)
                 return result
-            except (RuntimeError, zipfile.BadZipFile, Exception):
-                pass
+            self.progress = (result.attempts, total, word)
             if self.callback and result.attempts % 200 == 0:
-                self.callback(result.attempts, total, word, False)
+                self.callback(result.attempts, total, word.decode('utf-8', 'replace'), False)
 
         result.elapsed = time.time() - start
         result.speed = result.attempts / max(result.elapsed, 0.001)
         zf.close()
-        import shutil
-        shutil.rmtree(tmp_dir, ignore_errors=True)
         return result
 
     def stop(self):
         self.stopped = True
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 class PDFCracker:
+    SHARD_SIZE = 128
+    PARALLEL_THRESHOLD = 1000
+
     def __init__(self, callback=None, log_callback=None):
         self.callback = callback
         self.log_callback = log_callback
         self.stopped = False
+        self.progress = (0, 0, b'')
+        self._stop_event = None
 
     def _log(self, msg):
         if self.log_callback:
@@ -657,50 +1054,43 @@ class PDFCracker:
             result.method = "Error: pikepdf not installed (pip install pikepdf)"
             return result
         try:
-            words = []
-            with open(wordlist_path, 'r', errors='ignore') as f:
-                for line in f:
-                    w = line.strip()
-                    if w:
-                        words.append(w)
+            words = load_wordlist(wordlist_path)
         except FileNotFoundError:
             result.method = "Error: Wordlist not found"
             return result
 
         priority_count = 0
         if keyword_filter and keyword_filter.keywords:
-            pq, rq = keyword_filter.filter_wordlist(words)
-            priority_list = pq.to_list()
-            remaining_list = rq.to_list()
-            priority_count = len(priority_list)
-            ordered = priority_list + remaining_list
+            ordered = list(keyword_filter.filter_wordlist(words))
+            priority_count = keyword_filter.priority_count
             self._log(f"[KEYWORD PRIORITY] {priority_count} words matched keywords, trying those FIRST")
             if priority_count <= 20:
-                for pw in priority_list:
-                    self._log(f"  >> Priority: {pw}")
+                for pw in ordered[:priority_count]:
+                    self._log(f"  >> Priority: {pw.decode('utf-8', 'replace')}")
         else:
             ordered = words
 
         total = len(ordered)
+        if _WORKERS > 1 and total >= self.PARALLEL_THRESHOLD:
+            return _crack_file_parallel(self, _crack_pdf_shard, pdf_path, ordered,
+                                        priority_count, result, start)
         for i, word in enumerate(ordered):
             if self.stopped:
                 break
             result.attempts += 1
             if priority_count > 0 and i == priority_count:
                 self._log(f"[KEYWORD PRIORITY] Done with priority words, now trying remaining {len(ordered) - priority_count} words...")
-            try:
-                with pikepdf.open(pdf_path, password=word) as pdf:
-                    result.found = True
-                    result.password = word
-                    result.elapsed = time.time() - start
-                    result.speed = result.attempts / max(result.elapsed, 0.001)
-                    if self.callback:
-                        self.callback(result.attempts, total, word, True)
-                    return result
-            except Exception:
-                pass
+            if _pdf_password_ok(pikepdf, pdf_path, word):
+                result.found = True
+                result.password = word.decode('utf-8', 'replace')
+                result.elapsed = time.time() - start
+                result.speed = result.attempts / max(result.elapsed, 0.001)
+                if self.callback:
+                    self.callback(result.attempts, total, result.password, True)
+                return result
+            self.progress = (result.attempts, total, word)
             if self.callback and result.attempts % 100 == 0:
-                self.callback(result.attempts, total, word, False)
+                self.callback(result.attempts, total, word.decode('utf-8', 'replace'), False)
 
         result.elapsed = time.time() - start
         result.speed = result.attempts / max(result.elapsed, 0.001)
@@ -708,6 +1098,8 @@ class PDFCracker:
 
     def stop(self):
         self.stopped = True
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 # =============================================================================
@@ -715,16 +1107,26 @@ class PDFCracker:
 # =============================================================================
 
 class HashGenerator:
+    # Every context is fed the same slice before moving on, so long inputs
+    # are swept once while each slice is still in cache.
+    CHUNK_SIZE = 65536
+
     @staticmethod
     def generate(text, algo):
         return HashEngine.compute(text, algo)
 
     @staticmethod
     def generate_all(text):
-        results = HashMap()
-        for algo in HashEngine.supported_algorithms():
-            results.put(algo, HashEngine.compute(text, algo))
-        return results
+        if isinstance(text, str):
+            text = text.encode('utf-8')
+        contexts = {algo: HashEngine.get_ctor(algo)() for algo in HashEngine.supported_algorithms()}
+        view = memoryview(text)
+        size = HashGenerator.CHUNK_SIZE
+        for offset in range(0, len(view), size):
+            chunk = view[offset:offset + size]
+            for ctx in contexts.values():
+                ctx.update(chunk)
+        return {algo: ctx.hexdigest() for algo, ctx in contexts.items()}
 
 
 # =============================================================================
@@ -780,6 +1182,15 @@ else:
         BORDER = '#1e2a3a'
         MUTED = '#6b7b8d'
 
+        POLL_MS = 33
+        _CHARSETS = {
+            'lowercase': string.ascii_lowercase.encode(),
+            'uppercase': string.ascii_uppercase.encode(),
+            'digits': string.digits.encode(),
+            'lowercase+digits': (string.ascii_lowercase + string.digits).encode(),
+            'all printable': (string.ascii_lowercase + string.ascii_uppercase + string.digits + '!@#$%').encode(),
+        }
+
         def __init__(self):
             self.root = tk.Tk()
             self.root.title("CrackVault")
@@ -796,10 +1207,13 @@ else:
             self.current_attack = None
             self.attack_thread = None
             self.keyword_filter = KeywordFilter()
-            self._setup_styles()
+            self._setup_essential_styles()
             self._build_ui()
+            self.root.after_idle(self._setup_extra_styles)
 
-        def _setup_styles(self):
+        # Styles needed for the first paint; button, combobox and progress bar
+        # styles are applied once the window is up and restyle their widgets.
+        def _setup_essential_styles(self):
             self.style = ttk.Style()
             self.style.theme_use('clam')
             self.style.configure('TNotebook', background=self.BG, borderwidth=0)
@@ -818,6 +1232,8 @@ else:
                                  font=('Segoe UI', 10))
             self.style.configure('Header.TLabel', background=self.CARD_BG, foreground=self.ACCENT,
                                  font=('Segoe UI', 11, 'bold'))
+
+        def _setup_extra_styles(self):
             self.style.configure('Action.TButton', background=self.BTN_BG, foreground='#000000',
                                  font=('Segoe UI', 10, 'bold'), borderwidth=0, padding=[16, 8])
             self.style.map('Action.TButton', background=[('active', '#33ccff')])
@@ -1083,7 +1499,7 @@ else:
             self.history_output = self._output(tab, height=22)
             self.history_output.pack(fill='both', expand=True, padx=8, pady=(0, 8))
 
-            self._refresh_history()
+            self.root.after(100, self._refresh_history)
 
         # =====================================================================
         # STATUS BAR
@@ -1122,22 +1538,39 @@ else:
             self.status_label.config(text=text)
 
         def _get_charset(self):
-            cs = self.charset_var.get()
-            if cs == 'lowercase': return string.ascii_lowercase
-            elif cs == 'uppercase': return string.ascii_uppercase
-            elif cs == 'digits': return string.digits
-            elif cs == 'lowercase+digits': return string.ascii_lowercase + string.digits
-            else: return string.ascii_lowercase + string.ascii_uppercase + string.digits + '!@#$%'
-
-        def _hash_progress_cb(self, current, total, word, found):
-            if total > 0:
-                self.progress_var.set((current / total) * 100)
-            self.root.after(0, lambda: self._status(f"Trying: {word}  |  Attempts: {current:,}"))
-
-        def _file_progress_cb(self, current, total, word, found):
-            if total > 0:
-                self.file_progress_var.set((current / total) * 100)
-            self.root.after(0, lambda: self._status(f"Trying: {word}  |  Attempts: {current:,}"))
+            return self._CHARSETS.get(self.charset_var.get(), self._CHARSETS['all printable'])
+
+        def _drain_log_queue(self, log_queue, output):
+            lines = []
+            try:
+                while True:
+                    lines.append(log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            if lines:
+                self._log(output, '\n'.join(lines))
+
+        # Each run keeps its own attack and result in ``state``, so two tabs
+        # cracking at once each track their own progress.
+        def _poll_attack(self, thread, state, progress_var, output, speed_label, shown=None):
+            # Checked before draining, so a finished thread's last lines are
+            # already queued when the result is shown.
+            alive = thread.is_alive()
+            if 'log_queue' in state:
+                self._drain_log_queue(state['log_queue'], output)
+            if alive:
+                attack = state.get('attack')
+                if attack is not None and attack.progress != shown:
+                    shown = attack.progress
+                    current, total, word = shown
+                    if total > 0:
+                        progress_var.set((current / total) * 100)
+                    if current:
+                        self._status(f"Trying: {word.decode('utf-8', 'replace')}  |  Attempts: {current:,}")
+                self.root.after(self.POLL_MS, self._poll_attack, thread, state,
+                                progress_var, output, speed_label, shown)
+            elif 'result' in state:
+                self._show_result(state['result'], output, speed_label)
 
         # =====================================================================
         # ACTIONS
@@ -1164,6 +1597,8 @@ else:
             self._log(self.hash_output, f"{'_' * 60}\n")
             self.progress_var.set(0)
             self.hash_speed_lbl.config(text="")
+            self.current_attack = None
+            state = {}
 
             def run():
                 if mode == 'Wordlist':
@@ -1171,30 +1606,32 @@ else:
                     if not wl:
                         self.root.after(0, lambda: messagebox.showwarning("CrackVault", "Select a wordlist file."))
                         return
-                    attack = WordlistAttack(callback=self._hash_progress_cb)
-                    self.current_attack = attack
+                    attack = WordlistAttack()
+                    state['attack'] = self.current_attack = attack
                     result = attack.crack_hash(target, algo, wl, self.keyword_filter)
                 elif mode == 'Brute Force':
                     charset = self._get_charset()
                     mn, mx = int(self.bf_min.get()), int(self.bf_max.get())
-                    attack = BruteForceAttack(callback=self._hash_progress_cb)
-                    self.current_attack = attack
+                    attack = BruteForceAttack()
+                    state['attack'] = self.current_attack = attack
                     result = attack.crack_hash(target, algo, charset, mn, mx)
                 else:
                     wl = self.wl_entry.get().strip()
                     if not wl:
                         self.root.after(0, lambda: messagebox.showwarning("CrackVault", "Select a wordlist file."))
                         return
-                    attack = RuleBasedAttack(callback=self._hash_progress_cb)
-                    self.current_attack = attack
+                    attack = RuleBasedAttack()
+                    state['attack'] = self.current_attack = attack
                     result = attack.crack_hash(target, algo, wl, self.keyword_filter)
 
                 self.session_log.add(result)
-                self.root.after(0, lambda: self._show_result(result, self.hash_output, self.hash_speed_lbl))
+                state['result'] = result
 
             self.attack_thread = threading.Thread(target=run, daemon=True)
             self.attack_thread.start()
             self._status("Cracking...")
+            self.root.after(self.POLL_MS, self._poll_attack, self.attack_thread, state,
+                            self.progress_var, self.hash_output, self.hash_speed_lbl)
 
         def _start_file_crack(self):
             file_path = self.file_entry.get().strip()
@@ -1217,23 +1654,24 @@ else:
             self._log(self.file_output, f"{'_' * 60}\n")
             self.file_progress_var.set(0)
             self.file_speed_lbl.config(text="")
+            self.current_attack = None
+            state = {'log_queue': queue.Queue()}
 
             def run():
-                def file_log(msg):
-                    self.root.after(0, lambda m=msg: self._log(self.file_output, m))
-
                 if ftype == 'ZIP':
-                    attack = ZipCracker(callback=self._file_progress_cb, log_callback=file_log)
+                    attack = ZipCracker(log_callback=state['log_queue'].put_nowait)
                 else:
-                    attack = PDFCracker(callback=self._file_progress_cb, log_callback=file_log)
-                self.current_attack = attack
+                    attack = PDFCracker(log_callback=state['log_queue'].put_nowait)
+                state['attack'] = self.current_attack = attack
                 result = attack.crack(file_path, wl, kw_filter)
                 self.session_log.add(result)
-                self.root.after(0, lambda: self._show_result(result, self.file_output, self.file_speed_lbl))
+                state['result'] = result
 
             self.attack_thread = threading.Thread(target=run, daemon=True)
             self.attack_thread.start()
             self._status("Cracking file...")
+            self.root.after(self.POLL_MS, self._poll_attack, self.attack_thread, state,
+                            self.file_progress_var, self.file_output, self.file_speed_lbl)
 
         def _show_result(self, result, output, speed_label):
             self._log(output, f"\n{'=' * 60}")
@@ -1284,24 +1722,23 @@ else:
                 for m in matches:
                     self._log(self.id_output, f"    ->  {m}")
             else:
-                self._log(self.id_output, "  No matching algorithm found for this hash length.")
+                self._log(self.id_output, "  No matching algorithm found for this hash.")
             self._log(self.id_output, f"{'=' * 60}")
 
         def _refresh_history(self):
             entries = self.session_log.get_all()
             self.history_count_lbl.config(text=f"{len(entries)} entries")
-            self._log(self.history_output, f"  Session History\n{'=' * 60}", clear=True)
+            lines = [f"  Session History\n{'=' * 60}"]
             if not entries:
-                self._log(self.history_output, "  No history yet. Start cracking!")
+                lines.append("  No history yet. Start cracking!")
             else:
-                for i, e in enumerate(entries, 1):
+                for e in entries:
                     status = "CRACKED" if e['found'] else "FAILED"
-                    color_tag = 'found' if e['found'] else 'fail'
-                    self._log(self.history_output,
-                              f"  [{e['time']}]  {status:8s}  |  {e['method']:20s}  |  "
-                              f"Password: {e['password']:16s}  |  {e['attempts']} attempts  |  "
-                              f"{e['elapsed']}  |  {e['speed']}")
-            self._log(self.history_output, f"{'=' * 60}")
+                    lines.append(f"  [{e['time']}]  {status:8s}  |  {e['method']:20s}  |  "
+                                 f"Password: {e['password']:16s}  |  {e['attempts']} attempts  |  "
+                                 f"{e['elapsed']}  |  {e['speed']}")
+            lines.append('=' * 60)
+            self._log(self.history_output, '\n'.join(lines), clear=True)
 
         def _clear_history(self):
             if messagebox.askyesno("CrackVault", "Clear all session history?"):
@@ -1318,5 +1755,6 @@ else:
 # =============================================================================
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     app = CrackVaultApp()
     app.run()
@@ -0,0 +1,43 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crack_vault import RuleBasedAttack
+
+
+class TestRuleBasedAttack(unittest.TestCase):
+    def setUp(self):
+        fd, self.wordlist = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('hello\ncafé\nworld\n')
+
+    def tearDown(self):
+        os.remove(self.wordlist)
+
+    def _crack(self, password):
+        target = hashlib.md5(password.encode('utf-8')).hexdigest()
+        return RuleBasedAttack().crack_hash(target, 'md5', self.wordlist)
+
+    def test_ascii_rule_hit(self):
+        result = self._crack('Hello123')
+        self.assertTrue(result.found)
+        self.assertEqual(result.password, 'Hello123')
+
+    def test_non_ascii_upper(self):
+        result = self._crack('CAFÉ')
+        self.assertTrue(result.found)
+        self.assertEqual(result.password, 'CAFÉ')
+        self.assertEqual(result.attempts, 45)
+
+    def test_non_ascii_reverse(self):
+        result = self._crack('éfac')
+        self.assertTrue(result.found)
+        self.assertEqual(result.attempts, 49)
+
+
+if __name__ == '__main__':
+    unittest.main()